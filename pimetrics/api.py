@@ -0,0 +1,84 @@
+# Copyright 2020 by Christophe Lambin
+# All rights reserved.
+
+"""
+APIProbe measures values reported by an HTTP API
+"""
+
+import logging
+from abc import ABC
+from enum import Enum
+import requests
+from pimetrics.probe import Probe
+
+
+class APIProbe(Probe, ABC):
+    """
+    APIProbe measures values reported by an API. See https://github.com/clambin/pimon for an example.
+
+    Currently only HTTP GET & POST are supported.
+
+    Since API calls require specific setup, measure should be overriden to specify application-specific logic.
+    """
+
+    class Method(Enum):
+        GET = 1
+        POST = 2
+
+    def __init__(self, url, proxy=None, is_json=True):
+        """
+        :param url: the base URL for the API service. Will be extended by the endpoint specified in get/post
+        :param proxy: URL of Proxy server
+        """
+        super().__init__()
+        self.url = url
+        self.proxies = APIProbe._build_proxy_map(proxy)
+        self._is_json = is_json
+
+    @property
+    def is_json(self):
+        return self._is_json
+
+    @is_json.setter
+    def is_json(self, value):
+        self._is_json = value
+
+    @staticmethod
+    def _build_proxy_map(url):
+        if url:
+            if len(url.split('://')) != 2:
+                url = f'http://{url}'
+            return {'http': url, 'https': url}
+        return None
+
+    def get(self, endpoint='', headers=None, body=None, params=None):
+        """Call the API via HTTP GET"""
+        url = f'{self.url}{endpoint}' if endpoint else self.url
+        if self.is_json:
+            return requests.get(url, headers=headers, json=body, params=params, proxies=self.proxies)
+        else:
+            return requests.get(url, headers=headers, data=body, params=params, proxies=self.proxies)
+
+    def post(self, endpoint='', headers=None, body=None, params=None):
+        """Call the API via HTTP POST"""
+        url = f'{self.url}{endpoint}' if endpoint else self.url
+        if self.is_json:
+            return requests.post(url, headers=headers, json=body, params=params, proxies=self.proxies)
+        else:
+            return requests.post(url, headers=headers, data=body, params=params, proxies=self.proxies)
+
+    def call(self, endpoint='', headers=None, body=None, params=None, method=Method.GET):
+        """Convenience wrapper function for HTTP GET/POST calls"""
+        try:
+            if method == APIProbe.Method.GET:
+                response = self.get(endpoint=endpoint, headers=headers, body=body, params=params)
+                if response.status_code == 200:
+                    return response.json() if self.is_json else response.content
+            else:
+                response = self.post(endpoint=endpoint, headers=headers, body=body, params=params)
+                if response.status_code == 201:
+                    return response.json() if self.is_json else response.content
+            logging.error("%d - %s" % (response.status_code, response.reason))
+        except requests.exceptions.RequestException as err:
+            logging.warning(f'Failed to call "{self.url}": "{err}')
+        return None
@@ -6,15 +6,28 @@ A set of Probes to measure values from different sources and report them to a re
 Prometheus)
 """
 
-import queue
-import shlex
-import subprocess  # nosec
-import threading
-import requests
-from enum import Enum
-import logging
 from abc import ABC, abstractmethod
 
+__all__ = ['Probe', 'Probes', 'FileProbe', 'SysFSProbe', 'ProcessProbe', 'APIProbe']
+
+# ProcessProbe and APIProbe pull in subprocess/threading and requests respectively. They live in their own
+# modules and are only imported when first accessed, so that e.g. SysFSProbe-only deployments start up quickly.
+_LAZY_PROBES = {
+    'ProcessProbe': 'pimetrics.process',
+    'APIProbe': 'pimetrics.api',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PROBES:
+        module = __import__(_LAZY_PROBES[name], fromlist=[name])
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_PROBES))
+
 
 class Probe(ABC):
     """
@@ -153,139 +166,3 @@ class SysFSProbe(FileProbe):
         """Measure the value in the file, taking into account the specified divider"""
         content = super().measure()
         return float(content) / self.divider
-
-
-class _ProcessReader:
-    """
-    Helper class for ProcessProbe
-    """
-    def __init__(self, cmd):
-        self.cmd = cmd
-        self.process = subprocess.Popen(shlex.split(cmd), stdout=subprocess.PIPE, encoding='utf-8')  # nosec
-        self.queue = queue.Queue()
-        self.thread = threading.Thread(target=self._enqueue_output)
-        self.thread.daemon = True
-        self.thread.start()
-
-    def _enqueue_output(self):
-        for line in iter(self.process.stdout.readline, ''):
-            self.queue.put(line)
-        self.process.stdout.close()
-
-    def read(self):
-        out = []
-        try:
-            while True:
-                line = self.queue.get_nowait()
-                out.append(line)
-        except queue.Empty:
-            pass
-        return out
-
-    def running(self):
-        return self.thread.is_alive() or not self.queue.empty()
-
-
-class ProcessProbe(Probe):
-    """
-    ProcessProbe measures values reported by an externally spawned process.
-
-    Typical example would be to report latency & packet loss measured by a ping command.
-    See https://github.com/clambin/pinger for an example
-    """
-    def __init__(self, cmd):
-        """
-        Class constructor.
-
-        :param cmd: command to run
-        """
-        super().__init__()
-        self.cmd = cmd
-        self.reader = _ProcessReader(cmd)
-
-    def running(self):
-        """Check if the spawned process is still running. Useful to see if the Probe should be recreated."""
-        return self.reader.running()
-
-    def measure(self):
-        """Read the output of the spawned command. Processing logic should be in ProcessProbe.process()."""
-        output = None
-        # process may not have any data to measure
-        while output is None:
-            lines = []
-            for line in self.reader.read():
-                lines.append(line)
-            output = lines
-        return output
-
-
-class APIProbe(Probe, ABC):
-    """
-    APIProbe measures values reported by an API. See https://github.com/clambin/pimon for an example.
-
-    Currently only HTTP GET & POST are supported.
-
-    Since API calls require specific setup, measure should be overriden to specify application-specific logic.
-    """
-
-    class Method(Enum):
-        GET = 1
-        POST = 2
-
-    def __init__(self, url, proxy=None, is_json=True):
-        """
-        :param url: the base URL for the API service. Will be extended by the endpoint specified in get/post
-        :param proxy: URL of Proxy server
-        """
-        super().__init__()
-        self.url = url
-        self.proxies = APIProbe._build_proxy_map(proxy)
-        self._is_json = is_json
-
-    @property
-    def is_json(self):
-        return self._is_json
-
-    @is_json.setter
-    def is_json(self, value):
-        self._is_json = value
-
-    @staticmethod
-    def _build_proxy_map(url):
-        if url:
-            if len(url.split('://')) != 2:
-                url = f'http://{url}'
-            return {'http': url, 'https': url}
-        return None
-
-    def get(self, endpoint='', headers=None, body=None, params=None):
-        """Call the API via HTTP GET"""
-        url = f'{self.url}{endpoint}' if endpoint else self.url
-        if self.is_json:
-            return requests.get(url, headers=headers, json=body, params=params, proxies=self.proxies)
-        else:
-            return requests.get(url, headers=headers, data=body, params=params, proxies=self.proxies)
-
-    def post(self, endpoint='', headers=None, body=None, params=None):
-        """Call the API via HTTP POST"""
-        url = f'{self.url}{endpoint}' if endpoint else self.url
-        if self.is_json:
-            return requests.post(url, headers=headers, json=body, params=params, proxies=self.proxies)
-        else:
-            return requests.post(url, headers=headers, data=body, params=params, proxies=self.proxies)
-
-    def call(self, endpoint='', headers=None, body=None, params=None, method=Method.GET):
-        """Convenience wrapper function for HTTP GET/POST calls"""
-        try:
-            if method == APIProbe.Method.GET:
-                response = self.get(endpoint=endpoint, headers=headers, body=body, params=params)
-                if response.status_code == 200:
-                    return response.json() if self.is_json else response.content
-            else:
-                response = self.post(endpoint=endpoint, headers=headers, body=body, params=params)
-                if response.status_code == 201:
-                    return response.json() if self.is_json else response.content
-            logging.error("%d - %s" % (response.status_code, response.reason))
-        except requests.exceptions.RequestException as err:
-            logging.warning(f'Failed to call "{self.url}": "{err}')
-        return None
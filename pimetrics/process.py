@@ -0,0 +1,76 @@
+# Copyright 2020 by Christophe Lambin
+# All rights reserved.
+
+"""
+ProcessProbe measures values reported by an externally spawned process
+"""
+
+import queue
+import shlex
+import subprocess  # nosec
+import threading
+from pimetrics.probe import Probe
+
+
+class _ProcessReader:
+    """
+    Helper class for ProcessProbe
+    """
+    def __init__(self, cmd):
+        self.cmd = cmd
+        self.process = subprocess.Popen(shlex.split(cmd), stdout=subprocess.PIPE, encoding='utf-8')  # nosec
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._enqueue_output)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _enqueue_output(self):
+        for line in iter(self.process.stdout.readline, ''):
+            self.queue.put(line)
+        self.process.stdout.close()
+
+    def read(self):
+        out = []
+        try:
+            while True:
+                line = self.queue.get_nowait()
+                out.append(line)
+        except queue.Empty:
+            pass
+        return out
+
+    def running(self):
+        return self.thread.is_alive() or not self.queue.empty()
+
+
+class ProcessProbe(Probe):
+    """
+    ProcessProbe measures values reported by an externally spawned process.
+
+    Typical example would be to report latency & packet loss measured by a ping command.
+    See https://github.com/clambin/pinger for an example
+    """
+    def __init__(self, cmd):
+        """
+        Class constructor.
+
+        :param cmd: command to run
+        """
+        super().__init__()
+        self.cmd = cmd
+        self.reader = _ProcessReader(cmd)
+
+    def running(self):
+        """Check if the spawned process is still running. Useful to see if the Probe should be recreated."""
+        return self.reader.running()
+
+    def measure(self):
+        """Read the output of the spawned command. Processing logic should be in ProcessProbe.process()."""
+        output = None
+        # process may not have any data to measure
+        while output is None:
+            lines = []
+            for line in self.reader.read():
+                lines.append(line)
+            output = lines
+        return output
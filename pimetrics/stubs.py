@@ -1,6 +1,6 @@
 from abc import ABC
 import json
-from pimetrics.probe import APIProbe
+from pimetrics.api import APIProbe
 
 
 class APIStub(APIProbe, ABC):
@@ -0,0 +1,76 @@
+import os
+import subprocess  # nosec
+import sys
+import pytest
+import pimetrics.probe
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ['requests', 'urllib3', 'subprocess', 'threading', 'queue', 'shlex', 'logging',
+                 'pimetrics.api', 'pimetrics.process', 'importlib', 'warnings']
+
+
+def importtime(statement):
+    """Run statement under python -X importtime and return the cumulative import time (us) per module"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],  # nosec
+                            cwd=ROOT, stderr=subprocess.PIPE, encoding='utf-8', check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or line.endswith('| imported package'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_probe_import():
+    startup = importtime('pass')
+    modules = importtime('import pimetrics.probe')
+    loaded = set(modules) - set(startup)
+    assert 'pimetrics.probe' in loaded
+    for module in HEAVY_MODULES:
+        assert module not in loaded
+
+
+def test_probe_import_time():
+    pytest.importorskip('requests')
+    # warm up the bytecode cache so neither measurement includes compilation
+    importtime('import pimetrics.api, pimetrics.process')
+    probe = importtime('import pimetrics.probe')['pimetrics.probe']
+    api = importtime('import pimetrics.api')['pimetrics.api']
+    assert probe * 5 < api
+
+
+def test_process_import():
+    modules = importtime('from pimetrics.probe import ProcessProbe')
+    assert 'subprocess' in modules
+    assert 'threading' in modules
+    assert 'requests' not in modules
+
+
+def test_api_import():
+    pytest.importorskip('requests')
+    modules = importtime('from pimetrics.probe import APIProbe')
+    assert 'requests' in modules
+    # requests itself pulls in threading & queue, so only check for what is specific to ProcessProbe
+    assert 'subprocess' not in modules
+    assert 'shlex' not in modules
+
+
+def test_lazy_process_probe():
+    import pimetrics.process
+    assert pimetrics.probe.ProcessProbe is pimetrics.process.ProcessProbe
+    assert 'ProcessProbe' in dir(pimetrics.probe)
+
+
+def test_lazy_api_probe():
+    pytest.importorskip('requests')
+    import pimetrics.api
+    assert pimetrics.probe.APIProbe is pimetrics.api.APIProbe
+    assert 'APIProbe' in dir(pimetrics.probe)
+    for name in pimetrics.probe.__all__:
+        assert getattr(pimetrics.probe, name) is not None
+
+
+def test_lazy_missing():
+    with pytest.raises(AttributeError):
+        getattr(pimetrics.probe, 'MissingProbe')